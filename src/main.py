@@ -1,3 +1,4 @@
+import asyncio
 from http import HTTPStatus
 from fastapi import FastAPI, Request, Response
 
@@ -8,14 +9,12 @@ from telegram import Update
 from telegram.ext import Application, CommandHandler
 from telegram.ext._contexttypes import ContextTypes
 
-from api import app
-
 # from bot.ptb import ptb
 # from bot import handlers, commands
 
 from config import TELEGRAM_TOKEN, BOT_HOST
 
-# from common.log import logger
+from common.log import logger
 
 
 # Initialize telegram bot -> move to another file
@@ -30,11 +29,24 @@ ptb = (
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await ptb.bot.setWebhook(BOT_HOST)
-    async with ptb:
-            await  ptb.start()
-            yield
+    try:
+        # setting the webhook and initializing the bot (getMe) are independent requests;
+        # let both finish before raising so shutdown() never races initialize()
+        webhook_result, init_result = await asyncio.gather(
+            ptb.bot.setWebhook(BOT_HOST), ptb.initialize(), return_exceptions=True
+        )
+        if isinstance(init_result, BaseException):
+            if isinstance(webhook_result, BaseException):
+                logger.error("[BOT] Setting webhook failed as well: %r", webhook_result)
+            raise init_result
+        if isinstance(webhook_result, BaseException):
+            raise webhook_result
+        await ptb.start()
+        yield
+    finally:
+        if ptb.running:
             await ptb.stop()
+        await ptb.shutdown()
             
             
 # Initialize FastAPI app